@@ -1,12 +1,186 @@
 import streamlit as st
 import routeros_api
-import time
 import google.generativeai as genai
 import json
 import re
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+import threading
+import weakref
+from collections import OrderedDict
+
+# Matches the outermost JSON object in a model response. Kept greedy so the
+# nested "params" object stays inside the match.
+JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
 
 # --- Gemini AI Integration ---
-def get_ai_response(user_input, api_key):
+
+# The resource paths the assistant may use. Anything else returned by the model is
+# rejected locally instead of being sent to the router.
+COMMAND_PATHS = (
+    '/system/resource',
+    '/log',
+    '/interface',
+    '/ip/address',
+    '/ip/firewall/filter',
+    '/interface/wireless/registration-table',
+    '/ip/dhcp-server/lease',
+    '/system/reboot',
+)
+ALLOWED_PATHS = frozenset(COMMAND_PATHS)
+
+# This is the crucial part: We tell the AI how it should behave and what its goal is.
+# It is sent as the model's system instruction on every call, so it is kept to a
+# compact schema and a single example (roughly 130 tokens).
+SYSTEM_PROMPT = """Reply with raw JSON only: {"cmd":"/path","params":{}}; params are string filters or {}.
+Several requests: {"cmd":[{"cmd":"/path","params":{}},...],"params":{}}
+Paths: """ + " ".join(COMMAND_PATHS) + """
+E.g. "bound dhcp leases"->{"cmd":"/ip/dhcp-server/lease","params":{"status":"bound"}}
+"""
+
+
+# The Gemini model used to translate requests.
+GEMINI_MODEL = 'gemini-1.5-flash'
+
+def get_model(api_key):
+    """
+    Returns the Gemini model for this session, configuring the client only
+    when the API key changes so its HTTP/TLS setup is reused across turns.
+    """
+    cached = st.session_state.get('gemini_model')
+    if cached and cached[0] == api_key:
+        return cached[1]
+
+    genai.configure(api_key=api_key)
+    model = genai.GenerativeModel(GEMINI_MODEL, system_instruction=SYSTEM_PROMPT)
+    st.session_state['gemini_model'] = (api_key, model)
+    return model
+
+# Maximum number of prompt -> command translations kept in the response cache.
+AI_CACHE_MAX = 256
+
+@st.cache_resource
+def get_ai_cache():
+    """
+    Returns the LRU cache of AI translations and the lock guarding it.
+
+    Module-level state is rebuilt on every Streamlit rerun, so the cache lives
+    in a cached resource to survive reruns and be shared between sessions.
+    """
+    return OrderedDict(), threading.Lock()
+
+def lookup_cached_command(prompt_key):
+    """Returns the cached command for a normalized prompt, or None on a miss."""
+    cache, lock = get_ai_cache()
+    with lock:
+        command_info = cache.get(prompt_key)
+        if command_info is not None:
+            cache.move_to_end(prompt_key)
+        return command_info
+
+def store_cached_command(prompt_key, command_info):
+    """Caches a command for a normalized prompt, evicting the least recently used entry."""
+    cache, lock = get_ai_cache()
+    with lock:
+        cache[prompt_key] = command_info
+        cache.move_to_end(prompt_key)
+        if len(cache) > AI_CACHE_MAX:
+            cache.popitem(last=False)
+
+# Words that carry no meaning for intent routing ("show me the router uptime").
+FILLER_WORDS = frozenset({
+    'a', 'all', 'are', 'check', 'current', 'display', 'get', 'give', 'how', 'is',
+    'list', 'many', 'me', 'my', 'of', 'on', 'please', 'router', 's', 'show',
+    'tell', 'the', 'what', 'whats', 'which',
+})
+
+# Common requests that can be answered without asking Gemini. A pattern must
+# match the whole prompt once filler words are removed, so anything that adds a
+# filter ("dhcp leases for 10.0.0.5") still goes to the model.
+INTENT_TABLE = [
+    (re.compile(r'uptime|cpu(?: load| usage)?|memory(?: usage)?|(?:system )?resources?'),
+     {"cmd": "/system/resource", "params": {}}),
+    (re.compile(r'(?:wi-?fi|wireless) (?:clients|devices)|connected(?: wi-?fi| wireless)? (?:clients|devices)'),
+     {"cmd": "/interface/wireless/registration-table", "params": {}}),
+    (re.compile(r'dhcp(?: leases| clients)?|leases|(?:clients|devices) online|online (?:clients|devices)'),
+     {"cmd": "/ip/dhcp-server/lease", "params": {}}),
+    (re.compile(r'(?:system )?logs?(?: entries)?'),
+     {"cmd": "/log", "params": {}}),
+    (re.compile(r'firewall(?: filter)?(?: rules)?'),
+     {"cmd": "/ip/firewall/filter", "params": {}}),
+    (re.compile(r'ip address(?:es)?'),
+     {"cmd": "/ip/address", "params": {}}),
+    (re.compile(r'interfaces'),
+     {"cmd": "/interface", "params": {}}),
+]
+
+def intent_phrase(user_input):
+    """Returns the user input lower-cased, without punctuation or filler words."""
+    words = [word for word in re.findall(r"[a-z0-9-]+", user_input.lower()) if word not in FILLER_WORDS]
+    return " ".join(words)
+
+def match_phrase(phrase):
+    """Returns the INTENT_TABLE command whose pattern matches the whole phrase, or None."""
+    for pattern, command in INTENT_TABLE:
+        if pattern.fullmatch(phrase):
+            return command
+    return None
+
+def match_intent(user_input):
+    """Returns the command for a short, unambiguous request, or None."""
+    return match_phrase(intent_phrase(user_input))
+
+def match_compound_intents(user_input):
+    """
+    Returns the commands of a request made only of known phrases joined by
+    "and" (e.g. "wifi clients and dhcp leases"), or an empty list.
+    """
+    commands = [match_phrase(part) for part in re.split(r' (?:and|plus) ', intent_phrase(user_input))]
+    if len(commands) < 2 or None in commands:
+        return []
+    return commands
+
+def normalize_prompt(user_input):
+    """
+    Returns the key a prompt is stored under in the AI response cache. Only
+    whitespace is normalized: RouterOS filters such as interface names are
+    case-sensitive, so "WAN" and "wan" must not share an entry.
+    """
+    return " ".join(user_input.split())
+
+def stream_ai_text(model, user_prompt, placeholder=None):
+    """
+    Streams the model's reply and stops as soon as it contains a complete
+    JSON object, so the command can run before generation has finished.
+
+    Args:
+        model (genai.GenerativeModel): The model to query.
+        user_prompt (str): The prompt to send.
+        placeholder: Optional Streamlit element used to show progress.
+
+    Returns:
+        str: The text received from the model.
+    """
+    chunks = []
+    for chunk in model.generate_content(user_prompt, stream=True):
+        chunks.append(chunk.text)
+        text = "".join(chunks)
+        if placeholder is not None:
+            placeholder.markdown("AI thinking… " + text[-40:])
+
+        json_match = JSON_BLOCK_RE.search(text)
+        if json_match:
+            try:
+                orjson.loads(json_match.group(0).encode())
+                break
+            except json.JSONDecodeError:
+                # The closing brace seen so far belongs to "params"; keep reading.
+                continue
+    return "".join(chunks)
+
+def get_ai_response(user_input, api_key, placeholder=None):
     """
     Uses the Gemini API to analyze user input and determine the intended
     MikroTik command.
@@ -14,75 +188,51 @@ def get_ai_response(user_input, api_key):
     Args:
         user_input (str): The natural language command from the user.
         api_key (str): The Google AI API key.
+        placeholder: Optional Streamlit element that shows the streamed reply.
 
     Returns:
         dict: A dictionary containing the command path and parameters, or None.
     """
+    # Short, unambiguous requests are routed locally without an API call.
+    command_info = match_intent(user_input)
+    if command_info is not None:
+        return command_info
+
     if not api_key:
         st.error("Google AI API Key is not set. Please add it in the sidebar.")
         return None
 
+    # Repeated questions skip the round-trip to Gemini entirely.
+    prompt_key = normalize_prompt(user_input)
+    command_info = lookup_cached_command(prompt_key)
+    if command_info is not None:
+        return command_info
+
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-1.5-flash')
+        model = get_model(api_key)
     except Exception as e:
         st.error(f"Failed to configure AI model. Is your API key correct? Error: {e}")
         return None
 
 
-    # This is the crucial part: We tell the AI how it should behave and what its goal is.
-    system_prompt = """
-    You are a highly intelligent assistant for MikroTik RouterOS. Your only task is to translate a user's plain English request into a single, valid JSON object representing the corresponding RouterOS API resource path.
-
-    The JSON object MUST contain two keys:
-    1. "cmd": The API resource path as a string (e.g., "/system/resource"). DO NOT include "/print".
-    2. "params": A dictionary of parameters. This can be an empty dictionary {} if no parameters are needed.
-
-    YOU MUST ONLY OUTPUT THE RAW JSON OBJECT AND NOTHING ELSE. Do not include explanations, apologies, or any markdown formatting like ```json.
-
-    Here are some examples of API resource paths for your reference:
-    - /system/resource
-    - /log
-    - /interface
-    - /ip/address
-    - /ip/firewall/filter
-    - /interface/wireless/registration-table
-    - /ip/dhcp-server/lease
-    - /system/reboot
-
-    Example 1:
-    User request: "what is the router uptime?"
-    Your response:
-    {"cmd": "/system/resource", "params": {}}
-
-    Example 2:
-    User request: "show connected wifi devices"
-    Your response:
-    {"cmd": "/interface/wireless/registration-table", "params": {}}
-    
-    Example 3:
-    User request: "how many clients are online?"
-    Your response:
-    {"cmd": "/ip/dhcp-server/lease", "params": {}}
-
-    Now, process the following user request.
-    """
-    
     try:
-        full_prompt = f"{system_prompt}\nUser request: \"{user_input}\""
-        response = model.generate_content(full_prompt)
+        user_prompt = f"User request: \"{user_input}\""
+        response_text = stream_ai_text(model, user_prompt, placeholder)
         
         # Use regex to find the JSON block, making parsing more robust
-        json_match = re.search(r'\{.*\}', response.text, re.DOTALL)
+        json_match = JSON_BLOCK_RE.search(response_text)
         if not json_match:
             st.error("AI Response Error: The model did not return a valid command object.")
-            print(f"AI Raw Response: {response.text}") # For server-side debugging
+            print(f"AI Raw Response: {response_text}") # For server-side debugging
             return None
 
         command_str = json_match.group(0)
-        command_info = json.loads(command_str)
+        command_info = orjson.loads(command_str.encode())
         
         if "cmd" in command_info and isinstance(command_info.get("params"), dict):
+            # The cache is shared by every session, so only well-formed commands go in.
+            if validate_command(command_info) is None:
+                store_cached_command(prompt_key, command_info)
             return command_info
         else:
             st.error("AI Response Error: The returned command is missing required keys.")
@@ -90,7 +240,7 @@ def get_ai_response(user_input, api_key):
             
     except json.JSONDecodeError:
         st.error("AI Response Error: Failed to parse the command from the model's response.")
-        print(f"AI Raw Response (failed to parse): {response.text}")
+        print(f"AI Raw Response (failed to parse): {response_text}")
         return None
     except Exception as e:
         # Provide more specific feedback for common errors like invalid API key
@@ -104,13 +254,70 @@ def get_ai_response(user_input, api_key):
 
 # --- Core Chatbot Functions (mostly unchanged) ---
 
+REBOOT_MESSAGE = "Reboot command received. Please use the 'System Controls' section in the sidebar to confirm the reboot."
+
+# Seconds between keepalive requests on an idle router connection.
+KEEPALIVE_INTERVAL = 30
+
+def keep_connection_alive(connection, identity, lock, stop_ref, stale_event):
+    """
+    Runs in a background thread and sends a cheap request every
+    KEEPALIVE_INTERVAL seconds so the router does not drop the idle
+    connection.
+
+    The thread never touches the session: if the connection has died it sets
+    ``stale_event`` and exits, and the script reconnects on the next turn. The
+    session's stop event is only held through the weak reference ``stop_ref``,
+    so once the browser session is gone the thread closes the connection and
+    exits instead of pinging the router forever.
+    """
+    while True:
+        stop_event = stop_ref()
+        if stop_event is None:
+            with lock:
+                connection.disconnect()
+            return
+        if stop_event.wait(KEEPALIVE_INTERVAL):
+            return
+        del stop_event
+
+        try:
+            with lock:
+                identity.get()
+        except (routeros_api.exceptions.RouterOsApiConnectionError, OSError) as e:
+            print(f"Router connection lost: {e}")
+            stale_event.set()
+            return
+        except Exception as e:
+            print(f"Keepalive request failed: {e}")
+
 def connect_to_mikrotik(host, user, password):
     """Establishes a connection to the MikroTik router."""
     try:
         connection = routeros_api.RouterOsApiPool(host, username=user, password=password, plaintext_login=True)
         api = connection.get_api()
+        stop_keepalive()
         st.session_state['api_connection'] = api
         st.session_state['connection_pool'] = connection
+        st.session_state['router_credentials'] = (host, user, password)
+        # Resource handles are plain wrappers around the connection, so they are built once.
+        st.session_state['resources'] = {path: api.get_resource(path) for path in ALLOWED_PATHS if path != '/system/reboot'}
+        # Every use of the connection holds this lock, since the keepalive thread shares it.
+        st.session_state['api_lock'] = threading.Lock()
+        st.session_state['keepalive_stop'] = threading.Event()
+        st.session_state['connection_stale'] = threading.Event()
+
+        threading.Thread(
+            target=keep_connection_alive,
+            args=(
+                connection,
+                api.get_resource('/system/identity'),
+                st.session_state['api_lock'],
+                weakref.ref(st.session_state['keepalive_stop']),
+                st.session_state['connection_stale'],
+            ),
+            daemon=True,
+        ).start()
         return True
     except routeros_api.exceptions.RouterOsApiConnectionError as e:
         st.sidebar.error(f"Connection Error: {e}")
@@ -119,19 +326,169 @@ def connect_to_mikrotik(host, user, password):
         st.sidebar.error(f"An unexpected error occurred: {e}")
         return False
 
-def execute_command(api, command_info):
-    """Executes a command on the MikroTik router and returns the result."""
+def stop_keepalive():
+    """Stops the keepalive thread of the current connection, if any."""
+    stop_event = st.session_state.get('keepalive_stop')
+    if stop_event is not None:
+        stop_event.set()
+
+def disconnect_from_mikrotik():
+    """Closes the router connection and clears it from the session."""
+    stop_keepalive()
+    with st.session_state['api_lock']:
+        st.session_state.connection_pool.disconnect()
+    st.session_state['api_connection'] = None
+    st.session_state['connection_pool'] = None
+
+def reconnect_if_stale():
+    """Reopens the router connection if the keepalive thread found it dead."""
+    stale_event = st.session_state.get('connection_stale')
+    if st.session_state['api_connection'] and stale_event is not None and stale_event.is_set():
+        credentials = st.session_state['router_credentials']
+        disconnect_from_mikrotik()
+        connect_to_mikrotik(*credentials)
+
+def get_resource(api, cmd_path):
+    """Returns the resource handle for a path, reusing the one built at connect time."""
+    resource = st.session_state.get('resources', {}).get(cmd_path)
+    return resource or api.get_resource(cmd_path)
+
+def prefetch_command(api, user_input):
+    """
+    Sends the most likely command to the router without waiting for its reply.
+
+    This only happens for requests made only of known phrases, such as
+    "wifi clients and dhcp leases". Gemini still has to combine them, but its
+    answer almost always contains the guessed unfiltered command, so the
+    router round-trip overlaps with the AI call instead of following it.
+    Requests with extra words may carry filters the guess would miss, and are
+    not prefetched.
+
+    Returns:
+        tuple: The guessed command and its pending response, or None.
+    """
+    if lookup_cached_command(normalize_prompt(user_input)) is not None:
+        return None
+    guesses = match_compound_intents(user_input)
+    if not guesses:
+        return None
+
+    guess = guesses[0]
+    try:
+        return guess, get_resource(api, guess['cmd']).get_async(**guess['params'])
+    except Exception as e:
+        print(f"Prefetch of {guess['cmd']} failed: {e}")
+        return None
+
+def discard_prefetch(prefetched):
+    """Reads and drops an unused prefetched reply so it does not stay in the connection's buffer."""
+    try:
+        prefetched[1].get()
+    except Exception as e:
+        print(f"Discarded prefetch of {prefetched[0]['cmd']} failed: {e}")
+
+def command_steps(command_info):
+    """
+    Returns the (path, params) pairs a command runs: one for a single command,
+    one per entry of the list for a compound command.
+    """
+    cmd_path = command_info.get('cmd')
+    if not isinstance(cmd_path, list):
+        return [(cmd_path, command_info.get('params', {}))]
+    return [
+        (step.get('cmd'), step.get('params', {})) if isinstance(step, dict) else (step, {})
+        for step in cmd_path
+    ]
+
+def validate_command(command_info):
+    """
+    Checks every step of a command against ALLOWED_PATHS and the params schema.
+
+    Returns:
+        str: A message describing the problem, or None if the command is valid.
+    """
+    steps = command_steps(command_info)
+    if not steps:
+        return "The AI could not determine a valid command for your request. Please try rephrasing it."
+    unknown_paths = [str(path) for path, _ in steps if not isinstance(path, str) or path not in ALLOWED_PATHS]
+    if unknown_paths:
+        return f"Unknown command path: {', '.join(unknown_paths)}. Please try rephrasing your request."
+    # RouterOS query filters are string pairs; anything else would fail mid-batch when sent.
+    if not all(
+        isinstance(params, dict) and all(isinstance(k, str) and isinstance(v, str) for k, v in params.items())
+        for _, params in steps
+    ):
+        return "The AI returned invalid command parameters. Please try rephrasing your request."
+    return None
+
+def execute_batch(api, steps, prefetched_result=None):
+    """
+    Runs several commands in a single round-trip to the router.
+
+    Every command is sent over the open connection before any reply is read,
+    so a compound request takes about as long as its slowest command. A step
+    matching ``prefetched_result`` reuses that reply instead of being sent.
+
+    Returns:
+        list: A (path, params, result) tuple per step, where result may be an
+        error message.
+    """
+    pending = []
+    for cmd_path, params in steps:
+        if cmd_path == '/system/reboot':
+            pending.append((cmd_path, params, None, REBOOT_MESSAGE))
+        elif prefetched_result is not None and prefetched_result[0] == (cmd_path, params):
+            pending.append((cmd_path, params, None, prefetched_result[1]))
+            prefetched_result = None
+        else:
+            pending.append((cmd_path, params, get_resource(api, cmd_path).get_async(**params), None))
+
+    results = []
+    for cmd_path, params, promise, result in pending:
+        if promise is not None:
+            try:
+                result = promise.get()
+            except Exception as e:
+                result = f"An error occurred while executing the command: {e}"
+        results.append((cmd_path, params, result))
+    return results
+
+def execute_command(api, command_info, prefetched=None):
+    """
+    Executes a command on the MikroTik router and returns the result.
+
+    If ``prefetched`` (from prefetch_command) holds the command, or one step
+    of a compound command, its pending response is used instead of sending
+    that command again.
+    """
+    prefetched_result = None
+    if prefetched:
+        guess, pending = prefetched
+        # The reply is read even for a wrong guess so it does not linger in the buffer.
+        try:
+            result = pending.get()
+        except Exception as e:
+            result = f"An error occurred while executing the command: {e}"
+        prefetched_result = ((guess['cmd'], guess['params']), result)
+
     if not command_info:
         return "The AI could not determine a valid command for your request. Please try rephrasing it."
 
-    cmd_path = command_info['cmd']
-    params = command_info.get('params', {})
+    error = validate_command(command_info)
+    if error:
+        return error
+    steps = command_steps(command_info)
     
     try:
+        if isinstance(command_info['cmd'], list):
+            return execute_batch(api, steps, prefetched_result)
+        cmd_path, params = steps[0]
+        if prefetched_result is not None and prefetched_result[0] == (cmd_path, params):
+            return prefetched_result[1]
         if cmd_path == '/system/reboot':
-            return "Reboot command received. Please use the 'System Controls' section in the sidebar to confirm the reboot."
+            return REBOOT_MESSAGE
 
-        result = api.get_resource(cmd_path).get(**params)
+        result = get_resource(api, cmd_path).get(**params)
         return result
     except Exception as e:
         return f"An error occurred while executing the command: {e}"
@@ -140,6 +497,13 @@ def format_response(response, command_info):
     """Formats the API response for better readability and adds contextual info."""
     if isinstance(response, str):
         return response
+    if command_info and isinstance(command_info.get('cmd'), list):
+        # Compound request: format each step's result under its own heading.
+        return "".join(
+            f"#### `{' '.join([cmd_path] + [f'{k}={v}' for k, v in params.items()])}`\n\n"
+            + format_response(result, {"cmd": cmd_path, "params": params}) + "\n\n"
+            for cmd_path, params, result in response
+        )
     if not response:
         return "No results found or command executed successfully."
 
@@ -152,10 +516,11 @@ def format_response(response, command_info):
         count_string = f"### 💡 Found {count} active client(s) online.\n\n---\n\n"
 
 
-    formatted_string = ""
-    for item in response:
-        lines = [f"- **{k.replace('-', ' ').title()}**: `{v}`" for k, v in item.items()]
-        formatted_string += "\n".join(lines) + "\n\n---\n\n"
+    blocks = [
+        "\n".join(f"- **{k.replace('-', ' ').title()}**: `{v}`" for k, v in item.items())
+        for item in response
+    ]
+    formatted_string = "\n\n---\n\n".join(blocks) + "\n\n---\n\n"
     return count_string + formatted_string
 
 # --- Streamlit App UI ---
@@ -171,6 +536,8 @@ if 'connection_pool' not in st.session_state:
 if "messages" not in st.session_state:
     st.session_state.messages = [{"role": "assistant", "content": "Hello! Please provide your credentials and API key in the sidebar to get started."}]
 
+reconnect_if_stale()
+
 with st.sidebar:
     st.header("Router Connection")
     host = st.text_input("Router IP/Host", key="host")
@@ -183,11 +550,11 @@ with st.sidebar:
     if st.session_state['api_connection']:
         st.success(f"Connected to {host}")
         if st.button("Disconnect"):
-            st.session_state.connection_pool.disconnect()
-            st.session_state['api_connection'] = None
-            st.session_state['connection_pool'] = None
+            disconnect_from_mikrotik()
             st.rerun()
     else:
+        if st.session_state.pop('reboot_sent', False):
+            st.success("Reboot command sent successfully! Reconnect once the router is back online.")
         if st.button("Connect"):
             if host and user and api_key:
                 with st.spinner(f"Connecting to {host}..."):
@@ -202,13 +569,12 @@ with st.sidebar:
             st.warning("These actions can disrupt your network.")
             if st.button("REBOOT ROUTER NOW"):
                 try:
-                    reboot_resource = st.session_state.api_connection.get_binary_resource('/system/reboot')
-                    reboot_resource.call()
-                    st.success("Reboot command sent successfully!")
-                    time.sleep(5) 
-                    st.session_state.connection_pool.disconnect()
-                    st.session_state['api_connection'] = None
-                    st.session_state['connection_pool'] = None
+                    with st.session_state['api_lock']:
+                        reboot_resource = st.session_state.api_connection.get_binary_resource('/system')
+                        reboot_resource.call('reboot')
+                    # The router is going down, so drop the connection (and its keepalive) right away.
+                    disconnect_from_mikrotik()
+                    st.session_state['reboot_sent'] = True
                     st.rerun()
                 except Exception as e:
                     st.error(f"Failed to send reboot command: {e}")
@@ -233,8 +599,18 @@ if prompt := st.chat_input("Ask something about your router..."):
     with st.chat_message("assistant"):
         message_placeholder = st.empty()
         with st.spinner("AI is thinking..."):
-            command_info = get_ai_response(prompt, st.session_state.api_key)
-            response = execute_command(st.session_state['api_connection'], command_info)
+            with st.session_state['api_lock']:
+                prefetched = prefetch_command(st.session_state['api_connection'], prompt)
+            try:
+                command_info = get_ai_response(prompt, st.session_state.api_key, message_placeholder)
+                with st.session_state['api_lock']:
+                    response = execute_command(st.session_state['api_connection'], command_info, prefetched)
+                prefetched = None
+            finally:
+                # The run was interrupted (e.g. by a new prompt) before the prefetch was used.
+                if prefetched:
+                    with st.session_state['api_lock']:
+                        discard_prefetch(prefetched)
             formatted_output = format_response(response, command_info)
             message_placeholder.markdown(formatted_output)
     